@@ -2,23 +2,255 @@ import os
 import re
 import json
 from typing import Dict
+from contextlib import ExitStack, contextmanager
+from functools import lru_cache
+from operator import attrgetter
+from pathlib import Path
 from dataclasses import dataclass
-from datetime import datetime, time
+from datetime import datetime
 from typing import List, Optional
 from concurrent.futures import ThreadPoolExecutor
 from zoneinfo import ZoneInfo
 
-from bs4 import BeautifulSoup
-from dateutil import parser as dtparser
+import lxml.html
+from lxml import etree
 from playwright.sync_api import sync_playwright
 
 DEBUG = os.environ.get("DEBUG", "false").strip().lower() == "true"
 
+# Browser pool sizing. Each pool launches at most BROWSER_POOL_SIZE Chromium
+# processes (lazily, only when every existing one is busy) and replaces a
+# browser once it has served BROWSER_POOL_RECYCLE_AFTER contexts, so a long
+# run doesn't keep one ever-growing Chromium alive.
+BROWSER_POOL_SIZE = int(os.environ.get("BROWSER_POOL_SIZE", "2").strip())
+BROWSER_POOL_RECYCLE_AFTER = int(os.environ.get("BROWSER_POOL_RECYCLE_AFTER", "100").strip())
+
+# Sent on plain HTTP fetches (the Playwright default UA identifies itself
+# as a bot, which some booking sites reject).
+HTTP_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
+)
+
+# Images, fonts and media are never read by the scrapers, so contexts abort
+# them. Matching on URL means only those requests are routed through Python;
+# documents, scripts and XHR go straight through. Stylesheets are kept: the
+# MiClub click-through relies on elements actually being visible.
+BLOCKED_RESOURCE_RE = re.compile(
+    r"\.(?:png|jpe?g|gif|webp|avif|svg|ico|woff2?|ttf|otf|eot|mp4|webm|mp3)(?:[?#]|$)",
+    re.IGNORECASE,
+)
+
+BROWSER_ARGS = [
+    "--disable-blink-features=AutomationControlled",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+]
+
+# Patterns are compiled once here rather than inside the scrapers/row loops.
+TIME_RE = re.compile(r"\b(\d{1,2}:\d{2}\s*(AM|PM))\b", re.IGNORECASE)
+AMPM_RE = re.compile(r"^\s*(\d{1,2}):(\d{2})\s*([AaPp])[Mm]?\s*$")
+TIME_24H_RE = re.compile(r"\b([01]?\d|2[0-3]):[0-5]\d\b")
+AVAILABLE_RE = re.compile(r"\bavailable\b", re.IGNORECASE)
+NO_BOOKINGS_RE = re.compile(r"no bookings? available", re.IGNORECASE)
+PRICE_RE = re.compile(r"\$\s*\d+(?:\.\d{2})?", re.IGNORECASE)
+PRICE_SELECTOR = r"text=/\$\s*\d+(?:\.\d{2})?/"
+LABEL_18_RE = re.compile(r"^\s*18\s*Holes?\s*$", re.IGNORECASE)
+# Everything the slot validator looks for in a slot page's (lowercased) text,
+# as one alternation so the text is scanned once rather than seven times.
+SLOT_TEXT_RE = re.compile(
+    r"(?P<only_one>\bonly\s*1\s*player\b|\b1\s*player\s*only\b|\bonly\s*one\s*player\b"
+    r"|\bfor\s*1\s*player\b|\bsingle\s*player\b)"
+    r"|(?P<range>\b\d+\s*(?:to|-)\s*(?P<range_hi>\d+)\s*players?\b)"
+    r"|(?P<upto>\bup to\s*(?P<upto_hi>\d+)\s*players?\b)"
+)
+RANGE_RE = re.compile(r"\b(\d+)\s*(?:to|-)\s*(\d+)\s*players?\b")
+UPTO_RE = re.compile(r"\bup to\s*(\d+)\s*players?\b")
+NUMBER_RE = re.compile(r"\b(\d+)\b")
+DIGITS_RE = re.compile(r"\d+")
+SAFE_NAME_RE = re.compile(r"[^a-z0-9]+")
+
 def ensure_debug_dir():
     if DEBUG:
         os.makedirs("debug", exist_ok=True)
 
 @dataclass
+class _PooledBrowser:
+    browser: object
+    served: int = 0      # contexts handed out over this browser's lifetime
+    open_contexts: int = 0
+
+class BrowserPool:
+    """
+    Launches Chromium once and hands out isolated BrowserContexts:
+
+        with BrowserPool() as pool:
+            with pool.context() as ctx:
+                page = ctx.new_page()
+
+    Starting Chromium costs far more than creating a context, so scrapes
+    share browsers and only get a fresh context each (cookies/storage stay
+    isolated). Nothing is launched until the first context is requested.
+
+    Playwright's sync API is bound to the thread that started it, so a pool
+    must only be used from the thread that created it.
+    """
+
+    def __init__(self, size: int = BROWSER_POOL_SIZE, recycle_after: int = BROWSER_POOL_RECYCLE_AFTER):
+        self.size = max(size, 1)
+        self.recycle_after = max(recycle_after, 1)
+        self._playwright = None
+        self._request = None
+        self._browsers: List[_PooledBrowser] = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _start(self):
+        if self._playwright is None:
+            self._playwright = sync_playwright().start()
+        return self._playwright
+
+    @property
+    def request(self):
+        """
+        Shared APIRequestContext for plain HTTP fetches. It lives as long as
+        the pool, so repeat requests to the same host reuse connections.
+        """
+        if self._request is None:
+            self._request = self._start().request.new_context(
+                user_agent=HTTP_USER_AGENT,
+                extra_http_headers={"Accept-Language": "en-AU,en;q=0.9"},
+            )
+        return self._request
+
+    def get_text(self, url: str, timeout_ms: int = 15_000) -> str:
+        """Plain HTTP GET of url; "" on any error or non-2xx response."""
+        try:
+            resp = self.request.get(url, timeout=timeout_ms)
+            return resp.text() if resp.ok else ""
+        except Exception:
+            return ""
+
+    def _checkout(self) -> _PooledBrowser:
+        self._start()
+
+        # Retire browsers that crashed, or have used up their quota and are idle
+        for pb in list(self._browsers):
+            if not pb.browser.is_connected() or (pb.served >= self.recycle_after and pb.open_contexts == 0):
+                try:
+                    pb.browser.close()
+                except Exception:
+                    pass
+                self._browsers.remove(pb)
+
+        fresh = [pb for pb in self._browsers if pb.served < self.recycle_after]
+        idle = [pb for pb in fresh if pb.open_contexts == 0]
+        if idle:
+            pb = idle[0]
+        elif len(self._browsers) < self.size:
+            pb = _PooledBrowser(self._playwright.chromium.launch(headless=True, args=BROWSER_ARGS))
+            self._browsers.append(pb)
+        else:
+            pb = min(fresh or self._browsers, key=lambda x: x.open_contexts)
+
+        pb.served += 1
+        pb.open_contexts += 1
+        return pb
+
+    @contextmanager
+    def context(self, **kwargs):
+        pb = self._checkout()
+        try:
+            ctx = pb.browser.new_context(**kwargs)
+        except Exception:
+            pb.open_contexts -= 1
+            raise
+        try:
+            ctx.route(BLOCKED_RESOURCE_RE, lambda route: route.abort())
+            yield ctx
+        finally:
+            try:
+                ctx.close()
+            except Exception:
+                pass
+            pb.open_contexts -= 1
+
+    def close(self):
+        if self._request is not None:
+            try:
+                self._request.dispose()
+            except Exception:
+                pass
+            self._request = None
+        for pb in self._browsers:
+            try:
+                pb.browser.close()
+            except Exception:
+                pass
+        self._browsers = []
+        if self._playwright is not None:
+            try:
+                self._playwright.stop()
+            except Exception:
+                pass
+            self._playwright = None
+
+def load_slot_page(page, url: str, debug_name: str) -> str:
+    """Navigate an existing page to a slot URL and return its rendered HTML."""
+    # content() is captured below, so the whole document must have been
+    # parsed first; "commit" could hand back a half-streamed page.
+    page.goto(url, wait_until="domcontentloaded", timeout=60_000)
+    try:
+        page.wait_for_selector("select", timeout=5_000)
+    except Exception:
+        pass
+    html = page.content()
+
+    if DEBUG:
+        page.screenshot(path=f"debug/{debug_name}.png", full_page=True)
+        with open(f"debug/{debug_name}.html", "w", encoding="utf-8") as f:
+            f.write(html)
+
+    return html
+
+def fetch_slot_doc(pool: BrowserPool, url: str, debug_name: str, page=None):
+    """
+    Fetch a booking slot page over plain HTTP, falling back to a real page
+    load only when the response doesn't look like a slot page (eg an error
+    or login page, or a JS shell): it must have a player dropdown or state
+    a player count in its visible text.
+    If page is given the fallback navigates it instead of opening a context.
+    Returns (parsed document, lowercased visible text).
+    """
+    html = pool.get_text(url)
+    try:
+        # A blank or comment-only body is "Document is empty" to lxml;
+        # that's not a slot page either, so it falls through to the browser
+        doc = parse_html(html) if html else None
+    except etree.ParserError:
+        doc = None
+    if doc is not None:
+        page_text = node_text(doc).lower()
+        if PLAYER_SELECTS_XPATH(doc) or any(scan_slot_text(page_text)):
+            if DEBUG:
+                with open(f"debug/{debug_name}.html", "w", encoding="utf-8") as f:
+                    f.write(html)
+            return doc, page_text
+
+    if page is not None:
+        html = load_slot_page(page, url, debug_name)
+    else:
+        with pool.context() as ctx:
+            html = load_slot_page(ctx.new_page(), url, debug_name)
+
+    doc = parse_html(html)
+    return doc, node_text(doc).lower()
+
+@dataclass(slots=True, frozen=True)
 class TeeTime:
     course: str
     play_date: str  # YYYY-MM-DD
@@ -26,30 +258,110 @@ class TeeTime:
     players_hint: Optional[str]
     booking_url: str
 
-def parse_hhmm_24(s: str) -> time:
+# The two time parsers below are pure functions of their input, and the same
+# handful of tee-time strings repeat across rows, courses and slot pages, so
+# they're memoised. Callers pass regex-captured (already trimmed) strings.
+@lru_cache(maxsize=512)
+def hhmm_to_minutes(s: str) -> int:
+    """Convert "HH:MM" (24h) to minutes since midnight, so cutoffs compare as ints."""
     hh, mm = s.strip().split(":")
-    return time(int(hh), int(mm))
+    return int(hh) * 60 + int(mm)
 
+@lru_cache(maxsize=512)
 def ampm_to_24h(t: str) -> Optional[str]:
-    t = t.strip()
-    try:
-        dt = dtparser.parse(t)
-        return dt.strftime("%H:%M")
-    except Exception:
+    """Convert "8:30 AM" -> "08:30"; returns None if t isn't H:MM AM/PM."""
+    m = AMPM_RE.match(t)
+    if not m:
+        return None
+    h, mi, ap = int(m.group(1)), int(m.group(2)), m.group(3).lower()
+    if not (1 <= h <= 12) or mi > 59:
         return None
+    if ap == "p" and h != 12:
+        h += 12
+    elif ap == "a" and h == 12:
+        h = 0
+    return f"{h:02d}:{mi:02d}"
+
+# Text nodes the way BS4's get_text() saw them: no comments, scripts or styles.
+_TEXT_NODES = etree.XPath(".//text()[not(ancestor::script) and not(ancestor::style)]", smart_strings=False)
+
+_LOWERED_TEXT = "translate(normalize-space(.), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')"
+
+# Tables that could be the Quick18 search matrix: they mention Select.
+# libxml2 drops the rest without their text ever reaching Python. The holes
+# labels are checked in find_quick18_matrix() on space-joined text instead,
+# since XPath's string value glues "18<br>Holes" into "18holes".
+QUICK18_MATRIX_CANDIDATES_XPATH = etree.XPath(
+    f"//table[contains({_LOWERED_TEXT}, 'select')]"
+)
+
+# Within that table, the header row: first of the first 8 rows mentioning
+# 18 and hole(s).
+QUICK18_HEADER_ROW_XPATH = etree.XPath(
+    f"(.//tr)[position() <= 8][contains({_LOWERED_TEXT}, '18') and contains({_LOWERED_TEXT}, 'hole')][1]"
+)
+
+# Its rows that could be a bookable slot: Select text plus an H:MM time.
+QUICK18_SELECT_ROWS_XPATH = etree.XPath(
+    f".//tr[contains({_LOWERED_TEXT}, 'select') and contains(., ':')]"
+)
+
+# Selects treated as a player dropdown: "player" in the id/name/class or in
+# any option's text, matched case-insensitively.
+PLAYER_SELECTS_XPATH = etree.XPath(
+    "//select[contains(translate(concat(@id, ' ', @name, ' ', @class),"
+    " 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'player')"
+    f" or .//option[contains({_LOWERED_TEXT}, 'player')]]"
+)
+
+def parse_html(html: str):
+    """Parse an HTML string straight into an lxml tree."""
+    try:
+        return lxml.html.document_fromstring(html)
+    except ValueError:
+        # lxml refuses str input that carries an XML encoding declaration
+        return lxml.html.document_fromstring(html.encode("utf-8"))
 
-def is_before_or_equal(hhmm: str, latest: time) -> bool:
-    t = parse_hhmm_24(hhmm)
-    return (t.hour, t.minute) <= (latest.hour, latest.minute)
+def node_text(el) -> str:
+    """Whitespace-joined, stripped text of el (same as BS4 get_text(" ", strip=True))."""
+    return " ".join(t for t in (s.strip() for s in _TEXT_NODES(el)) if t)
 
-def get_timesheet_context(page):
+def text_mentions_all(el, phrases) -> bool:
     """
-    Returns (ctx, kind) where ctx is either:
-      - the main page, or
-      - a frame that actually contains the MiClub timesheet.
-
-    This matters because MiClub often renders tee times inside an iframe,
-    which screenshots show but page.content() does NOT.
+    Whether every (lowercase) phrase occurs in node_text(el).lower(), walking
+    text nodes only until the last one turns up. A short tail of the text
+    seen so far is carried over, so phrases split across nodes
+    ("18<br>Holes") still match on the space-joined text.
+    """
+    pending = set(phrases)
+    keep = max(map(len, pending)) - 1
+    tail = ""
+    for s in _TEXT_NODES(el):
+        s = s.strip().lower()
+        if not s:
+            continue
+        chunk = f"{tail} {s}" if tail else s
+        pending = {p for p in pending if p not in chunk}
+        if not pending:
+            return True
+        tail = chunk[-keep:]
+    return False
+
+def find_quick18_matrix(doc):
+    """First table mentioning both 9 and 18 holes plus Select, or None."""
+    for table in QUICK18_MATRIX_CANDIDATES_XPATH(doc):
+        if text_mentions_all(table, ("18 holes", "9 holes", "select")):
+            return table
+    return None
+
+def class_xpath(cls: str) -> str:
+    """XPath predicate matching elements whose class list contains cls."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {cls} ')"
+
+def find_timesheet_context(page):
+    """
+    Returns (ctx, kind) for whichever of the main page or one of its frames
+    currently contains the MiClub timesheet, or None if neither does yet.
     """
     # 1) If the main page already has the timesheet, use it
     try:
@@ -66,8 +378,77 @@ def get_timesheet_context(page):
         except Exception:
             continue
 
+    return None
+
+def find_no_bookings_context(page, ignore_url: Optional[str] = None):
+    """
+    Returns (ctx, kind) for the main page or frame showing MiClub's
+    "no bookings available" notice, or None. Such days never get a
+    .time-wrapper, so there's nothing to wait for. Frames still at
+    ignore_url (the grid the click started from) don't count.
+    """
+    for fr in page.frames:
+        if ignore_url and fr.url == ignore_url:
+            continue
+        try:
+            if fr.get_by_text(NO_BOOKINGS_RE).count() > 0:
+                return (page, "page") if fr == page.main_frame else (fr, "frame")
+        except Exception:
+            continue
+    return None
+
+def scan_slot_text(page_text: str):
+    """
+    Single pass of SLOT_TEXT_RE over a slot page's lowercased text.
+    Returns (says_only_one_player, first range match, first "up to" match).
+    """
+    only_one = False
+    m_range = m_upto = None
+    # Every alternative mentions "player"; skip the regex on pages that don't
+    if "player" not in page_text:
+        return only_one, m_range, m_upto
+    for m in SLOT_TEXT_RE.finditer(page_text):
+        kind = m.lastgroup
+        if kind == "only_one":
+            only_one = True
+        elif kind == "range" and m_range is None:
+            m_range = m
+        elif kind == "upto" and m_upto is None:
+            m_upto = m
+        if only_one and m_range and m_upto:
+            break
+    return only_one, m_range, m_upto
+
+def get_timesheet_context(page):
+    """
+    Returns (ctx, kind) where ctx is either:
+      - the main page, or
+      - a frame that actually contains the MiClub timesheet.
+
+    This matters because MiClub often renders tee times inside an iframe,
+    which screenshots show but page.content() does NOT.
+    """
     # Fallback: just return the page
-    return page, "page"
+    return find_timesheet_context(page) or (page, "page")
+
+def wait_for_timesheet_context(page, grid_url: Optional[str] = None, timeout_ms: int = 10_000, poll_ms: int = 250):
+    """
+    get_timesheet_context(), but polls until the timesheet actually appears
+    (on the page, in a late-loading iframe, or in a tab the click opened)
+    instead of sleeping a fixed amount first. Clicks made via evaluate()
+    aren't waited on by Playwright, so a new tab or same-tab navigation may
+    only show up during the poll. Stops early if the day says there are no
+    bookings, and gives up after timeout_ms.
+    Returns (tab, ctx, kind); tab is the newest one on timeout.
+    """
+    for _ in range(max(timeout_ms // poll_ms, 1)):
+        for tab in reversed(page.context.pages):
+            found = find_timesheet_context(tab) or find_no_bookings_context(tab, grid_url)
+            if found:
+                return (tab, *found)
+        page.wait_for_timeout(poll_ms)
+    tab = page.context.pages[-1]
+    return (tab, *get_timesheet_context(tab))
     
 def looks_like_players_ok(players_hint: Optional[str], min_players: int) -> bool:
     """
@@ -81,19 +462,77 @@ def looks_like_players_ok(players_hint: Optional[str], min_players: int) -> bool
         return True
 
     s = players_hint.lower()
-    nums = [int(x) for x in re.findall(r"\d+", s)]
-    if not nums:
+    nums = DIGITS_RE.finditer(s)
+    first = next(nums, None)
+    if first is None:
         return True
 
-    if "to" in s and len(nums) >= 2:
-        return nums[1] >= min_players
+    # "N to M": M is the answer
+    if "to" in s:
+        second = next(nums, None)
+        if second is not None:
+            return int(second.group()) >= min_players
+
+    # Otherwise any number big enough will do; stop at the first one
+    return int(first.group()) >= min_players or any(int(m.group()) >= min_players for m in nums)
+
+def validate_hamersley_slot(pool: BrowserPool, page, booking_url: str, play_date: str, hhmm: str, min_players: int):
+    """
+    Open a Quick18 slot page and check it can take min_players.
+    Browser fallbacks reuse page. Returns (supports_min, players_hint); the
+    hint may be None.
+    """
+    slot_supports_min = True
+    slot_players_hint = None
+
+    try:
+        slot_doc, page_text = fetch_slot_doc(pool, booking_url, f"hamersley_slot_{play_date}_{hhmm.replace(':','')}", page)
+        says_only_one, m_range, m_upto = scan_slot_text(page_text)
+
+        # Hard reject if page clearly indicates only 1 player
+        if min_players >= 2 and says_only_one:
+            slot_supports_min = False
+
+        # Broad dropdown scan: pick the largest option value among selects that look like counts
+        best_max = None
+
+        for sel in PLAYER_SELECTS_XPATH(slot_doc):
+            nums = [int(mm.group(1)) for mm in map(NUMBER_RE.search, map(node_text, sel.iter("option"))) if mm]
+            if nums:
+                mx = max(nums)
+                if best_max is None or mx > best_max:
+                    best_max = mx
+
+        if best_max is not None:
+            if best_max < min_players:
+                slot_supports_min = False
+
+            # Only use as a display hint if it looks sane
+            # (most tee time slots are max 4; some clubs allow 5 or 6)
+            if best_max <= 6:
+                slot_players_hint = f"up to {best_max} players"
+            # else: don't overwrite the existing hint
+
+        # Range text (if present)
+        if m_range:
+            hi = int(m_range.group("range_hi"))
+            slot_players_hint = m_range.group(0)
+            if hi < min_players:
+                slot_supports_min = False
+
+        if m_upto:
+            hi = int(m_upto.group("upto_hi"))
+            slot_players_hint = m_upto.group(0)
+            if hi < min_players:
+                slot_supports_min = False
 
-    if "or" in s and len(nums) >= 2:
-        return max(nums) >= min_players
+    except Exception:
+        # If the slot page fails to load/transient error, don't block the whole run.
+        slot_supports_min = True
 
-    return max(nums) >= min_players
+    return slot_supports_min, slot_players_hint
 
-def scrape_quick18_hamersley(play_date: str, min_players: int, latest: time) -> List[TeeTime]:
+def scrape_quick18_hamersley(pool: BrowserPool, play_date: str, min_players: int, latest_min: int) -> List[TeeTime]:
     """
     Quick18 search matrix shows 9 Holes + 18 Holes columns.
     We only accept rows where the 18 Holes column has a clickable Select.
@@ -103,239 +542,161 @@ def scrape_quick18_hamersley(play_date: str, min_players: int, latest: time) ->
     base_url = "https://hamersley.quick18.com"
     url = f"{base_url}/teetimes/searchmatrix?teedate={yyyymmdd}"
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
-        page.goto(url, wait_until="domcontentloaded", timeout=60_000)
-        page.wait_for_timeout(1500)  # allow late render
-        html = page.content()
-
-        ensure_debug_dir()
-        if DEBUG:
-            page.screenshot(path=f"debug/hamersley_{play_date}.png", full_page=True)
-            with open(f"debug/hamersley_{play_date}.html", "w", encoding="utf-8") as f:
-                f.write(html)
-
-        browser.close()
-
-    soup = BeautifulSoup(html, "lxml")
-    results: List[TeeTime] = []
-
-    def expand_cells(cells) -> List[BeautifulSoup]:
-        expanded = []
-        for c in cells:
+    with ExitStack() as stack:
+        # The matrix is usually server-rendered, so try plain HTTP first and
+        # only bring up a browser page when the matrix table isn't actually in
+        # the static HTML (a JS shell can still mention holes and selects).
+        page = None
+        html = pool.get_text(url, timeout_ms=30_000)
+        try:
+            # A blank or comment-only body is "Document is empty" to lxml
+            doc = parse_html(html) if html else None
+        except etree.ParserError:
+            doc = None
+        target_table = find_quick18_matrix(doc) if doc is not None else None
+        if target_table is None:
+            page = stack.enter_context(pool.context()).new_page()
+            # Wait for the full document (content() is captured from it), then for
+            # the matrix to render. Days with nothing bookable may never show it;
+            # parse whatever the document holds.
+            page.goto(url, wait_until="domcontentloaded", timeout=60_000)
             try:
-                colspan = int(c.get("colspan", 1))
+                page.wait_for_selector("table:has-text('18 Holes')", timeout=10_000)
             except Exception:
-                colspan = 1
-            expanded.extend([c] * max(colspan, 1))
-        return expanded
-
-    # Pick the table that actually contains both 9 and 18 holes and select links
-    target_table = None
-    for t in soup.find_all("table"):
-        t_text = t.get_text(" ", strip=True).lower()
-        if ("18 holes" in t_text) and ("9 holes" in t_text) and ("select" in t_text):
-            target_table = t
-            break
-
-    if not target_table:
-        return results
+                pass
+            html = page.content()
+            doc = parse_html(html)
+            target_table = find_quick18_matrix(doc)
 
-    # Find a header row containing "18 Holes"
-    header_row = None
-    for tr in target_table.find_all("tr")[:8]:
-        tr_text = tr.get_text(" ", strip=True).lower()
-        if ("18 holes" in tr_text) or (("18" in tr_text) and ("hole" in tr_text)):
-            header_row = tr
-            break
+            if DEBUG:
+                page.screenshot(path=f"debug/hamersley_{play_date}.png", full_page=True)
 
-    if not header_row:
-        return results
+        if DEBUG:
+            with open(f"debug/hamersley_{play_date}.html", "w", encoding="utf-8") as f:
+                f.write(html)
 
-    header_cells = expand_cells(header_row.find_all(["th", "td"]))
-    headers = [c.get_text(" ", strip=True).lower() for c in header_cells]
+        # Any context stays open while rows are checked: once the matrix HTML
+        # is in hand its page is reused for slots that need a real load.
+        # Keyed by tee time as rows are accepted; the first bookable row for a
+        # time wins, and later rows for that time skip the slot-page check.
+        results: Dict[str, TeeTime] = {}
+        seen_urls = set()
+
+        def logical_cells(cells):
+            """Yield (first logical column, colspan, cell) without expanding colspans."""
+            col = 0
+            for c in cells:
+                try:
+                    colspan = max(int(c.get("colspan", 1)), 1)
+                except Exception:
+                    colspan = 1
+                yield col, colspan, c
+                col += colspan
+
+        def cell_at(cells, target_col: int):
+            """The cell covering logical column target_col, or None if the row is too short."""
+            for col, colspan, c in logical_cells(cells):
+                if col + colspan > target_col:
+                    return c
+            return None
 
-    col_18 = None
-    for i, h in enumerate(headers):
-        if "18 holes" in h:
-            col_18 = i
-            break
-    if col_18 is None:
-        for i, h in enumerate(headers):
-            if ("18" in h) and ("hole" in h):
-                col_18 = i
+        # No table with both 9 and 18 holes and select links, even after a real load
+        if target_table is None:
+            return []
+
+        # Find a header row containing "18 Holes"
+        header_row = next(iter(QUICK18_HEADER_ROW_XPATH(target_table)), None)
+        if header_row is None:
+            return []
+
+        # (first logical column, lowercased text) per header cell
+        headers = [(i, node_text(c).lower()) for i, _, c in logical_cells(header_row.xpath(".//th|.//td"))]
+
+        col_18 = next((i for i, h in headers if "18 holes" in h), None)
+        if col_18 is None:
+            col_18 = next((i for i, h in headers if ("18" in h) and ("hole" in h)), None)
+        if col_18 is None:
+            return []
+
+        # Find the "Players" column too (so we don't accidentally parse the time as a player count)
+        col_players = None
+        for i, h in headers:
+            if h.strip() == "players" or "players" in h:
+                col_players = i
                 break
-    if col_18 is None:
-        return results
-
-    # Find the "Players" column too (so we don't accidentally parse the time as a player count)
-    col_players = None
-    for i, h in enumerate(headers):
-        if h.strip() == "players" or "players" in h:
-            col_players = i
-            break
         
-    time_re = re.compile(r"\b(\d{1,2}:\d{2}\s*(AM|PM))\b", re.IGNORECASE)
-
-    # Rows with Select somewhere (cheaper filter)
-    for tr in target_table.find_all("tr"):
-        tr_text = tr.get_text(" ", strip=True)
-        if "select" not in tr_text.lower():
-            continue
-
-        m = time_re.search(tr_text)
-        if not m:
-            continue
-
-        hhmm = ampm_to_24h(m.group(1))
-        if not hhmm or not is_before_or_equal(hhmm, latest):
-            continue
-
-        row_cells = expand_cells(tr.find_all(["td", "th"]))
-        if col_18 >= len(row_cells):
-            continue
-
-        cell_18 = row_cells[col_18]
-
-        # Find a real link in the 18-holes cell
-        select_link = cell_18.find("a", string=re.compile(r"select", re.IGNORECASE))
-        href = select_link.get("href") if select_link else None
-        if not href:
-            continue
-
-        booking_url = href if href.startswith("http") else f"{base_url}{href}"
-
-        # Initialize hint early so later code can reference safely
-        players_hint = None
-        if col_players is not None and col_players < len(row_cells):
-            players_hint = row_cells[col_players].get_text(" ", strip=True) or None
-
-        # --- Validate min_players by opening the slot page ---
-        slot_supports_min = True
-        slot_players_hint = players_hint
-
-        try:
-            with sync_playwright() as p2:
-                b2 = p2.chromium.launch(headless=True)
-                pg2 = b2.new_page()
-                pg2.goto(booking_url, wait_until="domcontentloaded", timeout=60_000)
-                pg2.wait_for_timeout(1200)
-                slot_html = pg2.content()
-
-                ensure_debug_dir()
-                if DEBUG:
-                    pg2.screenshot(path=f"debug/hamersley_slot_{play_date}_{hhmm.replace(':','')}.png", full_page=True)
-                    with open(f"debug/hamersley_slot_{play_date}_{hhmm.replace(':','')}.html", "w", encoding="utf-8") as f:
-                        f.write(slot_html)
-
-                b2.close()
-
-            slot_soup = BeautifulSoup(slot_html, "lxml")
-            page_text = slot_soup.get_text(" ", strip=True).lower()
-
-            # Hard reject if page clearly indicates only 1 player
-            if min_players >= 2:
-                only_one_patterns = [
-                    r"\bonly\s*1\s*player\b",
-                    r"\b1\s*player\s*only\b",
-                    r"\bonly\s*one\s*player\b",
-                    r"\bfor\s*1\s*player\b",
-                    r"\bsingle\s*player\b",
-                ]
-                if any(re.search(pat, page_text) for pat in only_one_patterns):
-                    slot_supports_min = False
-
-            # Broad dropdown scan: pick the largest option value among selects that look like counts
-            selects = slot_soup.find_all("select")
-            best_max = None
-
-            for sel in selects:
-                attr_blob = " ".join([
-                    (sel.get("id") or ""),
-                    (sel.get("name") or ""),
-                    " ".join(sel.get("class") or []),
-                ]).lower()
-
-                option_texts = [opt.get_text(" ", strip=True).lower() for opt in sel.find_all("option")]
-                options_blob = " ".join(option_texts)
-
-                # Only treat as player dropdown if "player" appears in select attrs or option text
-                if "player" not in attr_blob and "player" not in options_blob:
-                    continue
-
-                nums = []
-                for txt in option_texts:
-                    mm = re.search(r"\b(\d+)\b", txt)
-                    if mm:
-                        nums.append(int(mm.group(1)))
-
-                if nums:
-                    mx = max(nums)
-                    if best_max is None or mx > best_max:
-                        best_max = mx
-
-            if best_max is not None:
-                if best_max < min_players:
-                    slot_supports_min = False
-
-                # Only use as a display hint if it looks sane
-                # (most tee time slots are max 4; some clubs allow 5 or 6)
-                if best_max <= 6:
-                    slot_players_hint = f"up to {best_max} players"
-                # else: don't overwrite the existing hint
-
-            # Range text (if present)
-            m_range = re.search(r"\b(\d+)\s*(?:to|-)\s*(\d+)\s*players?\b", page_text)
-            if m_range:
-                hi = int(m_range.group(2))
-                slot_players_hint = m_range.group(0)
-                if hi < min_players:
-                    slot_supports_min = False
-
-            m_upto = re.search(r"\bup to\s*(\d+)\s*players?\b", page_text)
-            if m_upto:
-                hi = int(m_upto.group(1))
-                slot_players_hint = m_upto.group(0)
-                if hi < min_players:
-                    slot_supports_min = False
-
-        except Exception:
-            # If the slot page fails to load/transient error, don't block the whole run.
-            slot_supports_min = True
-
-        if not slot_supports_min:
-            continue
-
-        # Use the hint only if it actually looks like a player hint
-        if slot_players_hint and ("player" in slot_players_hint.lower()) and ("up to 20" not in slot_players_hint.lower()):
-            players_hint = slot_players_hint
-        # otherwise: keep the existing players_hint from the matrix row
-        else:
+        # Rows with Select and a time somewhere; the rest never reach Python
+        for tr in QUICK18_SELECT_ROWS_XPATH(target_table):
+            tr_text = node_text(tr)
+
+            m = TIME_RE.search(tr_text)
+            if not m:
+                continue
+
+            hhmm = ampm_to_24h(m.group(1))
+            if not hhmm or hhmm_to_minutes(hhmm) > latest_min:
+                continue
+            if hhmm in results:
+                continue
+
+            row_cells = tr.xpath(".//td|.//th")
+            cell_18 = cell_at(row_cells, col_18)
+            if cell_18 is None:
+                continue
+
+            # Find a real link in the 18-holes cell
+            select_link = next((a for a in cell_18.iter("a") if "select" in node_text(a).lower()), None)
+            href = select_link.get("href") if select_link is not None else None
+            if not href:
+                continue
+
+            booking_url = href if href.startswith("http") else f"{base_url}{href}"
+
+            # A slot link only needs checking once, whichever row it shows up in
+            if booking_url in seen_urls:
+                continue
+            seen_urls.add(booking_url)
+
+            # Initialize hint early so later code can reference safely
             players_hint = None
+            players_cell = cell_at(row_cells, col_players) if col_players is not None else None
+            if players_cell is not None:
+                players_hint = node_text(players_cell) or None
+
+            # The matrix row may already state the player range; if so, or if any
+            # single player will do, there's nothing the slot page can add.
+            hint_l = players_hint.lower() if players_hint else ""
+            m_row = RANGE_RE.search(hint_l) or UPTO_RE.search(hint_l)
+            if m_row:
+                if int(m_row.group(m_row.lastindex)) < min_players:
+                    continue
+            elif min_players >= 2:
+                slot_ok, slot_hint = validate_hamersley_slot(pool, page, booking_url, play_date, hhmm, min_players)
+                if not slot_ok:
+                    continue
+                # Use the slot hint only if it actually looks like a player hint;
+                # otherwise keep the existing players_hint from the matrix row
+                slot_hint_l = slot_hint.lower() if slot_hint else ""
+                if ("player" in slot_hint_l) and ("up to 20" not in slot_hint_l):
+                    players_hint = slot_hint
 
-        results.append(
-            TeeTime(
+            results[hhmm] = TeeTime(
                 course="Hamersley Public Golf Course",
                 play_date=play_date,
                 tee_time=hhmm,
                 players_hint=players_hint,
                 booking_url=booking_url,
             )
-        )
 
-    # De-dupe by time
-    uniq = {}
-    for r in results:
-        uniq[(r.course, r.play_date, r.tee_time)] = r
-    return sorted(uniq.values(), key=lambda x: x.tee_time)
+        return list(results.values())
 
 def scrape_miclub_public_calendar(
+    pool: BrowserPool,
     course_name: str,
     calendar_url_template: str,
     play_date: str,
     min_players: int,
-    latest: time,
+    latest_min: int,
 ) -> List[TeeTime]:
     """
     MiClub public calendar (2-step):
@@ -352,50 +713,42 @@ def scrape_miclub_public_calendar(
     final_url = url
     ts_html = ""
 
-    ensure_debug_dir()
-    safe = re.sub(r"[^a-z0-9]+", "_", course_name.lower()).strip("_")
-
-    with sync_playwright() as p:
-        browser = p.chromium.launch(
-            headless=True,
-            args=[
-                "--disable-blink-features=AutomationControlled",
-                "--no-sandbox",
-                "--disable-dev-shm-usage",
-            ],
-        )
+    # Only needed for debug artifact names
+    safe = SAFE_NAME_RE.sub("_", course_name.lower()).strip("_") if DEBUG else ""
 
-        context = browser.new_context(
-            user_agent=(
-                "Mozilla/5.0 (iPhone; CPU iPhone OS 18_0 like Mac OS X) "
-                "AppleWebKit/605.1.15 (KHTML, like Gecko) "
-                "Version/18.0 Mobile/15E148 Safari/604.1"
-            ),
-            viewport={"width": 390, "height": 844},
-            device_scale_factor=3,
-            is_mobile=True,
-            has_touch=True,
-            locale="en-AU",
-            timezone_id="Australia/Perth",
-            extra_http_headers={
-                "Accept-Language": "en-AU,en;q=0.9",
-                "Cache-Control": "no-cache",
-                "Pragma": "no-cache",
-            },
-        )
+    with pool.context(
+        user_agent=(
+            "Mozilla/5.0 (iPhone; CPU iPhone OS 18_0 like Mac OS X) "
+            "AppleWebKit/605.1.15 (KHTML, like Gecko) "
+            "Version/18.0 Mobile/15E148 Safari/604.1"
+        ),
+        viewport={"width": 390, "height": 844},
+        device_scale_factor=3,
+        is_mobile=True,
+        has_touch=True,
+        locale="en-AU",
+        timezone_id="Australia/Perth",
+        extra_http_headers={
+            "Accept-Language": "en-AU,en;q=0.9",
+            "Cache-Control": "no-cache",
+            "Pragma": "no-cache",
+        },
+    ) as context:
 
         page = context.new_page()
-        page.goto(url, wait_until="domcontentloaded", timeout=60_000)
+        page.goto(url, wait_until="commit", timeout=60_000)
         # The fee grid is rendered client-side (jQuery), so a fixed sleep
         # here is a race: under CI load it can fire before any price cell
         # exists, making every click strategy below find nothing to click
         # (count() doesn't wait/retry, unlike click()/waitFor()). Wait for
         # actual price text to show up instead, with a generous budget.
         try:
-            page.wait_for_selector(r"text=/\$\s*\d+(?:\.\d{2})?/", timeout=20_000)
+            page.wait_for_selector(PRICE_SELECTOR, timeout=20_000)
         except Exception:
-            pass
-        page.wait_for_timeout(500)
+            try:
+                page.wait_for_load_state("domcontentloaded", timeout=20_000)
+            except Exception:
+                pass
 
         # --- DEBUG: grid page ---
         if DEBUG:
@@ -410,14 +763,12 @@ def scrape_miclub_public_calendar(
                 pass
 
                 # -------- CLICK THROUGH TO THE DAY TIMESHEET --------
+        grid_url = page.url
         clicked = False
-        price_re = re.compile(r"\$\s*\d+(?:\.\d{2})?", re.IGNORECASE)
 
         try:
             # Find the specific product label, rather than a large parent div
-            label18 = page.get_by_text(
-                re.compile(r"^\s*18\s*Holes?\s*$", re.IGNORECASE)
-            ).first
+            label18 = page.get_by_text(LABEL_18_RE).first
 
             label18.wait_for(state="visible", timeout=15_000)
 
@@ -431,14 +782,14 @@ def scrape_miclub_public_calendar(
                 # Prefer an actual clickable control containing a price
                 clickable_prices = row18.locator(
                     "a, button, [role='button'], [onclick]"
-                ).filter(has_text=price_re)
+                ).filter(has_text=PRICE_RE)
 
                 if clickable_prices.count() > 0:
                     clickable_prices.first.click(timeout=15_000)
                     clicked = True
                 else:
                     # Sometimes the price text is inside a clickable parent
-                    price_text = row18.get_by_text(price_re).first
+                    price_text = row18.get_by_text(PRICE_RE).first
                     price_text.wait_for(state="visible", timeout=15_000)
 
                     price_text.evaluate(
@@ -459,7 +810,7 @@ def scrape_miclub_public_calendar(
         # Fallback: use the first visible price anywhere on the grid
         if not clicked:
             try:
-                fallback_price = page.get_by_text(price_re).first
+                fallback_price = page.get_by_text(PRICE_RE).first
                 fallback_price.wait_for(state="visible", timeout=15_000)
 
                 fallback_price.evaluate(
@@ -478,7 +829,7 @@ def scrape_miclub_public_calendar(
                 print(f"[{course_name}] fallback price click failed: {fallback_error}")
         if not clicked:
             try:
-                page.locator(r"text=/\$\s*\d+(?:\.\d{2})?/").first.click(timeout=15_000)
+                page.locator(PRICE_SELECTOR).first.click(timeout=15_000)
                 clicked = True
             except Exception:
                 clicked = False
@@ -492,7 +843,6 @@ def scrape_miclub_public_calendar(
                 clicked = False
 
         if not clicked:
-            browser.close()
             # Raise instead of silently returning empty: a genuine "nothing
             # available" case never reaches this branch (that's decided by
             # the row parsing below), so getting here means the click
@@ -505,28 +855,27 @@ def scrape_miclub_public_calendar(
             page.wait_for_load_state("networkidle", timeout=20_000)
         except Exception:
             pass
-        page.wait_for_timeout(1200)
-
-        # If a new tab opened, use it
-        if len(page.context.pages) > 1:
-            page = page.context.pages[-1]
-            try:
-                page.wait_for_load_state("domcontentloaded", timeout=10_000)
-            except Exception:
-                pass
-            page.wait_for_timeout(800)
 
+        # Get the correct timesheet tab and context (page vs iframe), waiting
+        # only as long as it takes for the timesheet to actually render. This
+        # also picks up a new tab the click opened, however late it registers.
+        page, ts_ctx, ts_kind = wait_for_timesheet_context(page, grid_url)
+        # Read only now: a same-tab navigation may not have committed earlier
         final_url = page.url
+        # The first .time-wrapper can appear while the frame is still
+        # streaming in; let its document finish before capturing it
+        try:
+            ts_ctx.wait_for_load_state("domcontentloaded", timeout=15_000)
+        except Exception:
+            pass
 
-        # Get the correct timesheet context (page vs iframe)
-        ts_ctx, ts_kind = get_timesheet_context(page)
-
-        # Give it another beat if we didn't find it yet
-        if ts_ctx is page:
-            page.wait_for_timeout(1200)
-            ts_ctx, ts_kind = get_timesheet_context(page)
+        # Capture timesheet HTML for parsing (do this BEFORE the context closes)
+        try:
+            ts_html = ts_ctx.content() if ts_kind == "frame" else page.content()
+        except Exception:
+            ts_html = page.content()
 
-        # --- DEBUG: timesheet screenshot + HTML (correct context) ---
+        # --- DEBUG: timesheet screenshot + the HTML captured above ---
         if DEBUG:
             try:
                 page.screenshot(path=f"debug/{safe}_times_{play_date}.png", full_page=True)
@@ -534,115 +883,114 @@ def scrape_miclub_public_calendar(
                 pass
             try:
                 with open(f"debug/{safe}_times_{play_date}.html", "w", encoding="utf-8") as f:
-                    if ts_kind == "frame":
-                        f.write(ts_ctx.content())
-                    else:
-                        f.write(page.content())
+                    f.write(ts_html)
             except Exception:
                 pass
 
-        # Capture timesheet HTML for parsing (do this BEFORE closing browser)
-        try:
-            ts_html = ts_ctx.content() if ts_kind == "frame" else page.content()
-        except Exception:
-            ts_html = page.content()
-
-        browser.close()
-
     # -------- PARSE TIMESHEET HTML --------
     if not ts_html:
         return results
 
-    soup = BeautifulSoup(ts_html, "lxml")
+    doc = parse_html(ts_html)
 
     # Quick early exit if page genuinely says no bookings
-    page_text = soup.get_text(" ", strip=True).lower()
-    if "no bookings available" in page_text or "no booking available" in page_text:
+    page_text = node_text(doc).lower()
+    if NO_BOOKINGS_RE.search(page_text):
         return results
 
-    time_re_ampm = re.compile(r"\b(\d{1,2}:\d{2}\s*(AM|PM))\b", re.IGNORECASE)
-    time_re_24h = re.compile(r"\b([01]?\d|2[0-3]):[0-5]\d\b")
-    available_word = re.compile(r"\bavailable\b", re.IGNORECASE)
-
     def extract_time_from_row(row) -> Optional[str]:
-        h3 = row.select_one(".time-wrapper h3")
-        if h3:
-            t = h3.get_text(" ", strip=True)
-            m = time_re_ampm.search(t)
+        h3 = next(iter(row.xpath(f".//h3[ancestor::*[{class_xpath('time-wrapper')}]]")), None)
+        if h3 is not None:
+            t = node_text(h3)
+            m = TIME_RE.search(t)
             if m:
                 return ampm_to_24h(m.group(1))
 
-        txt = row.get_text(" ", strip=True)
-        m = time_re_ampm.search(txt)
+        # Only walk the whole row when the heading didn't have it
+        txt = node_text(row)
+        m = TIME_RE.search(txt)
         if m:
             return ampm_to_24h(m.group(1))
 
-        m2 = time_re_24h.search(txt)
+        m2 = TIME_24H_RE.search(txt)
         return m2.group(0) if m2 else None
 
-    def row_available_count_if_bookable(row) -> Optional[int]:
+    def row_available_count_if_bookable(row, blob: str) -> Optional[int]:
         """
         Return number of "Available" slots for THIS time row, but only if:
           - it has the row selection affordance
           - and avail_count >= min_players
+        blob is the row's text, already lowercased by the caller.
         """
-        blob = row.get_text(" ", strip=True).lower()
-
-        has_select_affordance = ("click to select row" in blob) or ("rowbooktooltip" in str(row).lower())
+        has_select_affordance = ("click to select row" in blob) or ("rowbooktooltip" in lxml.html.tostring(row, encoding="unicode", with_tail=False).lower())
         if not has_select_affordance:
             return None
 
-        avail_count = len(available_word.findall(blob))
+        avail_count = len(AVAILABLE_RE.findall(blob))
         if avail_count < min_players:
             return None
 
         return avail_count
 
     # Prefer whole time rows (<div class="row row-time ...">)
-    candidates = soup.select("div.row.row-time")
+    candidates = doc.xpath(f"//div[{class_xpath('row')} and {class_xpath('row-time')}]")
     if not candidates:
         # fallback: some themes only expose time-wrapper blocks
-        candidates = soup.select(".time-wrapper")
+        candidates = doc.xpath(f"//*[{class_xpath('time-wrapper')}]")
 
     found: Dict[str, int] = {}
+    # Several time-wrapper fallbacks can climb to the same row; parse it once
+    seen_rows = set()
 
     for node in candidates:
         # If node is a .time-wrapper fallback, climb to the row-time container if possible
         row = node
-        if hasattr(node, "get") and node.get("class"):
-            cls = " ".join(node.get("class") or [])
-            if "time-wrapper" in cls:
-                parent = getattr(node, "parent", None)
-                while parent is not None and hasattr(parent, "get"):
-                    pcls = " ".join(parent.get("class") or [])
-                    if "row-time" in pcls:
-                        row = parent
-                        break
-                    parent = getattr(parent, "parent", None)
+        cls = node.get("class") or ""
+        if "time-wrapper" in cls:
+            parent = node.getparent()
+            while parent is not None:
+                pcls = parent.get("class") or ""
+                if "row-time" in pcls:
+                    row = parent
+                    break
+                parent = parent.getparent()
+
+        if row in seen_rows:
+            continue
+        seen_rows.add(row)
 
+        # Time first: rows past the cutoff never have their full text walked
         hhmm = extract_time_from_row(row)
-        if not hhmm or not is_before_or_equal(hhmm, latest):
+        if not hhmm or hhmm_to_minutes(hhmm) > latest_min:
             continue
 
-        avail_count = row_available_count_if_bookable(row)
+        avail_count = row_available_count_if_bookable(row, node_text(row).lower())
         if avail_count is None:
             continue
 
         # de-dupe by time, keep the highest availability if we see it twice
         found[hhmm] = max(found.get(hhmm, 0), avail_count)
 
-    for hhmm in sorted(found.keys()):
-        results.append(
-            TeeTime(
-                course=course_name,
-                play_date=play_date,
-                tee_time=hhmm,
-                players_hint=found[hhmm],
-                booking_url=final_url,
-            )
+    results = [
+        TeeTime(
+            course=course_name,
+            play_date=play_date,
+            tee_time=hhmm,
+            players_hint=avail_count,
+            booking_url=final_url,
         )
+        for hhmm, avail_count in found.items()
+    ]
 
-    return sorted(results, key=lambda x: x.tee_time)
+    return results
+
+def players_part(players_hint) -> str:
+    """Markdown suffix " 1 to N players" from the highest number in a hint, else ""."""
+    if not players_hint:
+        return ""
+    # Extract the highest number mentioned
+    max_players = max(map(int, DIGITS_RE.findall(str(players_hint))), default=None)
+    return f" 1 to {max_players} players" if max_players is not None else ""
 
 def render_markdown(all_results: List[TeeTime], play_date: str, min_players: int, latest_time: str) -> str:
     if not all_results:
@@ -668,34 +1016,48 @@ def render_markdown(all_results: List[TeeTime], play_date: str, min_players: int
         by_course.setdefault(r.course, []).append(r)
 
     for course, items in by_course.items():
-        lines += [f"## {course}", ""]
-        for r in items:
-            players_part = ""
-
-            if r.players_hint:
-                s = str(r.players_hint).lower()
-
-                # Extract the highest number mentioned
-                nums = [int(x) for x in re.findall(r"\d+", s)]
-                if nums:
-                    max_players = max(nums)
-                    players_part = f" 1 to {max_players} players"
-
-            lines.append(
-                f"- **{r.tee_time}**{players_part}  [open booking page]({r.booking_url})"
-            )
+        lines.extend((f"## {course}", ""))
+        lines.extend(
+            f"- **{r.tee_time}**{players_part(r.players_hint)}  [open booking page]({r.booking_url})"
+            for r in items
+        )
 
     return "\n".join(lines)
 
 
+def run_lane(jobs, play_date: str) -> List[TeeTime]:
+    """
+    Run (course, booking_url, fn) jobs one after another, each as fn(pool),
+    sharing a BrowserPool owned by this thread. A failing job becomes an
+    error TeeTime (empty tee_time) instead of aborting the rest of the lane.
+    """
+    results: List[TeeTime] = []
+    with BrowserPool() as pool:
+        for name, booking_url, fn in jobs:
+            try:
+                results += fn(pool)
+            except Exception as e:
+                results.append(
+                    TeeTime(
+                        course=name,
+                        play_date=play_date,
+                        tee_time="",
+                        players_hint=f"ERROR: {e}",
+                        booking_url=booking_url,
+                    )
+                )
+    return results
+
 def main():
     play_date = os.environ.get("PLAY_DATE", "").strip()
     if not play_date:
         raise SystemExit("PLAY_DATE env var missing.")
 
+    ensure_debug_dir()
+
     min_players = int(os.environ.get("MIN_PLAYERS", "2").strip())
     latest_time_str = os.environ.get("LATEST_TIME", "10:00").strip()
-    latest = parse_hhmm_24(latest_time_str)
+    latest_min = hhmm_to_minutes(latest_time_str)
 
     miclub_courses = [
         (
@@ -717,12 +1079,15 @@ def main():
         miclub_jobs.append((
             name,
             template.format(date=play_date),
-            lambda n=name, t=template: scrape_miclub_public_calendar(n, t, play_date, min_players, latest),
+            lambda pool, n=name, t=template: scrape_miclub_public_calendar(pool, n, t, play_date, min_players, latest_min),
         ))
     hamersley_name = "Hamersley Public Golf Course"
     hamersley_url = f"https://hamersley.quick18.com/teetimes/searchmatrix?teedate={play_date.replace('-', '')}"
-
-    all_results: List[TeeTime] = []
+    hamersley_jobs = [(
+        hamersley_name,
+        hamersley_url,
+        lambda pool: scrape_quick18_hamersley(pool, play_date, min_players, latest_min),
+    )]
 
     # Collier Park / Marangaroo / Whaleback all run on the same shared MiClub
     # platform. Running them concurrently previously triggered that platform's
@@ -730,44 +1095,27 @@ def main():
     # silently failed - not a timing issue, the pages simply stopped being
     # served). They must run one at a time, never overlapping. Hamersley is a
     # completely separate platform, so it's safe to run in parallel with them.
-    with ThreadPoolExecutor(max_workers=1) as hamersley_executor:
-        hamersley_future = hamersley_executor.submit(scrape_quick18_hamersley, play_date, min_players, latest)
+    #
+    # So each platform is a "lane": jobs inside a lane run sequentially, lanes
+    # run concurrently. Each lane thread owns its own BrowserPool because sync
+    # Playwright objects can't cross threads. Results are collected in lane
+    # order so the output doesn't depend on which platform finished first.
+    lanes = [miclub_jobs, hamersley_jobs]
 
-        for name, booking_url, fn in miclub_jobs:
-            try:
-                all_results += fn()
-            except Exception as e:
-                all_results.append(
-                    TeeTime(
-                        course=name,
-                        play_date=play_date,
-                        tee_time="",
-                        players_hint=f"ERROR: {e}",
-                        booking_url=booking_url,
-                    )
-                )
-
-        try:
-            all_results += hamersley_future.result()
-        except Exception as e:
-            all_results.append(
-                TeeTime(
-                    course=hamersley_name,
-                    play_date=play_date,
-                    tee_time="",
-                    players_hint=f"ERROR: {e}",
-                    booking_url=hamersley_url,
-                )
-            )
+    all_results: List[TeeTime] = []
+    with ThreadPoolExecutor(max_workers=len(lanes)) as executor:
+        futures = [executor.submit(run_lane, jobs, play_date) for jobs in lanes]
+        for fut in futures:
+            all_results += fut.result()
 
     good = [r for r in all_results if r.tee_time]
     bad = [r for r in all_results if not r.tee_time]
 
-    good_sorted = sorted(good, key=lambda x: (x.course, x.tee_time))
+    # The one sort for the run; scrapers return in page order
+    good_sorted = sorted(good, key=attrgetter("course", "tee_time"))
     md = render_markdown(good_sorted + bad, play_date, min_players, latest_time_str)
 
-    with open("tee_time_summary.md", "w", encoding="utf-8") as f:
-        f.write(md)
+    Path("tee_time_summary.md").write_bytes(md.encode("utf-8"))
 
     # --- App-style output: docs/results.json ---
     os.makedirs("docs", exist_ok=True)
@@ -789,7 +1137,7 @@ def main():
                 max_players = int(r.players_hint)
             except Exception:
                 # if it's already a string like "up to 4 players"
-                nums = [int(x) for x in re.findall(r"\d+", str(r.players_hint))]
+                nums = [int(x) for x in DIGITS_RE.findall(str(r.players_hint))]
                 max_players = max(nums) if nums else None
 
         hint = f"1 to {max_players} players" if max_players else None